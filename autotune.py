@@ -0,0 +1,130 @@
+import argparse
+import itertools
+import multiprocessing as mp
+import os
+
+import numpy as np
+
+from core.tuning import roads_per_host, run_benchmark, save_tuned_config
+
+
+def parse_size(text):
+
+    width, height = text.lower().split("x")
+    return int(width), int(height)
+
+
+def parse_args():
+
+    cores = os.cpu_count() or 1
+
+    parser = argparse.ArgumentParser(
+        description="Tune input size, torch threads and road frame rate "
+                    "for the most roads per host under a p95 latency target"
+    )
+    parser.add_argument(
+        "clips", nargs="*", default=["videos/highway.mp4"],
+        help="sample clips, benchmarked round-robin like roads in main.py"
+    )
+    parser.add_argument("--target-p95-ms", type=float, default=100.0)
+    parser.add_argument(
+        "--sizes", nargs="+", type=parse_size,
+        default=[(320, 224), (416, 288), (480, 320), (640, 416)]
+    )
+    parser.add_argument(
+        "--intra", nargs="+", type=int,
+        default=sorted({t for t in (1, 2, 4, cores) if t <= cores})
+    )
+    parser.add_argument("--inter", nargs="+", type=int, default=[1, 2])
+    parser.add_argument("--fps", nargs="+", type=float, default=[10, 15, 20])
+    parser.add_argument(
+        "--min-fps", type=float, default=10.0,
+        help="lowest per-road frame rate the result may use"
+    )
+    parser.add_argument("--frames", type=int, default=60, help="frames to measure")
+    parser.add_argument("--weights", default="yolov8n.pt")
+    parser.add_argument(
+        "--frame-cache", nargs="?", const="cache/frames", default=None,
+        metavar="DIR",
+        help="serve decoded, resized frames from a memory-mapped cache"
+             " (decode + resize is timed separately and added back)"
+    )
+    parser.add_argument("--out", default="configs/tuned_config.json")
+
+    return parser.parse_args()
+
+
+def main():
+
+    args = parse_args()
+    cores = os.cpu_count() or 1
+    target = args.target_p95_ms / 1000.0
+
+    print(f"\n[INFO] Auto-tuning on {cores} cores, p95 target {args.target_p95_ms:.0f}ms\n")
+
+    ctx = mp.get_context("spawn")
+    best = None
+
+    for size, intra, inter in itertools.product(args.sizes, args.intra, args.inter):
+
+        if intra > cores:
+            continue
+
+        config = {
+            "input_size": list(size),
+            "imgsz": int(np.ceil(max(size) / 32) * 32),
+            "intra_threads": intra,
+            "inter_threads": inter
+        }
+
+        try:
+            latencies = run_benchmark(
+                ctx, config, args.clips, args.frames, args.weights,
+                args.frame_cache
+            )
+        except RuntimeError as e:
+            print(f"\n[ERROR] {e}\n")
+            raise SystemExit(1)
+        mean_ms = latencies.mean() * 1000
+        p95_ms = np.percentile(latencies, 95) * 1000
+
+        print(f"[INFO] {size[0]}x{size[1]} intra={intra} inter={inter}:"
+              f" mean {mean_ms:.1f}ms p95 {p95_ms:.1f}ms")
+
+        for road_fps in args.fps:
+
+            if road_fps < args.min_fps:
+                continue
+
+            roads = roads_per_host(latencies, road_fps, target)
+            print(f"         @ {road_fps:g} fps/road → {roads} roads per host")
+
+            candidate = dict(
+                config,
+                road_fps=road_fps,
+                roads_per_host=roads,
+                mean_ms=round(mean_ms, 2),
+                p95_ms=round(p95_ms, 2),
+                target_p95_ms=args.target_p95_ms
+            )
+
+            # Most roads first; then higher frame rate, then bigger input
+            key = (roads, road_fps, size[0] * size[1])
+            if roads > 0 and (best is None or key > best[0]):
+                best = (key, candidate)
+
+    if best is None:
+        print("\n[WARN] No configuration meets the latency target\n")
+        return
+
+    config = best[1]
+    save_tuned_config(args.out, config)
+
+    print(f"\n[INFO] Best: {config['input_size'][0]}x{config['input_size'][1]}"
+          f" intra={config['intra_threads']} inter={config['inter_threads']}"
+          f" {config['road_fps']:g} fps → {config['roads_per_host']} roads per host")
+    print(f"[INFO] Tuned config written → {args.out}\n")
+
+
+if __name__ == "__main__":
+    main()
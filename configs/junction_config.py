@@ -25,3 +25,10 @@ JUNCTION_TYPES = {
         }
     }
 }
+
+
+# Far-field band per road: (top, bottom) as fractions of frame height,
+# covering the distant stretch of road near the horizon. Roads listed
+# here also run a high-resolution pass over that band.
+# Example: "MAIN": (0.30, 0.55)
+FAR_FIELD_BANDS = {}
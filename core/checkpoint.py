@@ -0,0 +1,87 @@
+import json
+import os
+import time
+
+
+class StateCheckpointer:
+    """
+    Warm Restart Checkpoints
+
+    Periodically saves per-road alert-hold state and the boxes +
+    approach counters of currently visible tracks to a small JSON
+    file, and restores it on startup.
+
+    Age is the downtime between the last save and process start, so
+    model loading is not counted against the checkpoint. A road's state
+    is rejected once the downtime exceeds its ALERT_HOLD_TIME (the held
+    alert would already have expired). Accepted alert holds are pushed
+    forward by the startup time, so the remaining hold still covers
+    the first live frames.
+    """
+
+    def __init__(self, filename="logs/checkpoint.json",
+                 interval=1.0, process_start=None):
+
+        os.makedirs(os.path.dirname(filename) or ".", exist_ok=True)
+        self.filename = filename
+        self.interval = interval
+        self.process_start = time.time() if process_start is None else process_start
+        self.last_save_time = 0
+
+    def maybe_save(self, analyzers):
+
+        now = time.time()
+        if now - self.last_save_time < self.interval:
+            return False
+
+        self.save(analyzers, now)
+        return True
+
+    def save(self, analyzers, now=None):
+
+        now = time.time() if now is None else now
+
+        checkpoint = {
+            "saved_at": now,
+            "roads": {a.road_name: a.export_state() for a in analyzers}
+        }
+
+        # Write-then-rename so a crash never leaves a torn file
+        tmp_name = self.filename + ".tmp"
+        with open(tmp_name, "w") as f:
+            json.dump(checkpoint, f, separators=(",", ":"))
+        os.replace(tmp_name, self.filename)
+
+        self.last_save_time = now
+
+    def restore(self, analyzers):
+
+        try:
+            with open(self.filename) as f:
+                checkpoint = json.load(f)
+        except (OSError, ValueError):
+            return []
+
+        downtime = self.process_start - checkpoint.get("saved_at", 0)
+        startup_delay = time.time() - self.process_start
+
+        restored = []
+        roads = checkpoint.get("roads", {})
+
+        for analyzer in analyzers:
+            state = roads.get(analyzer.road_name)
+            if state is None or not 0 <= downtime <= analyzer.ALERT_HOLD_TIME:
+                continue
+            state = dict(
+                state, last_alert_time=state["last_alert_time"] + startup_delay
+            )
+            analyzer.restore_state(state)
+            restored.append(analyzer.road_name)
+
+        if not restored:
+            print(f"[INFO] Checkpoint rejected (downtime {downtime:.1f}s)")
+            return []
+
+        print(f"[INFO] Warm restart from checkpoint (downtime {downtime:.1f}s):",
+              ", ".join(restored))
+        return restored
@@ -0,0 +1,147 @@
+import os
+import queue
+import threading
+import time
+
+import cv2
+import numpy as np
+
+
+class ClipRecorder:
+    """
+    Event-Triggered Clip Recorder (per road)
+
+    Keeps the last pre_seconds of frames in a pre-allocated ring buffer.
+    When the alert turns on, the pre-roll plus every frame until
+    post_seconds after the alert clears is handed to a background
+    encoder thread. push() never blocks: if the encoder falls too far
+    behind, frames are dropped and counted instead.
+    """
+
+    def __init__(self, road_name, fps=30.0, pre_seconds=5.0,
+                 post_seconds=5.0, out_dir="clips", max_pending=300):
+
+        os.makedirs(out_dir, exist_ok=True)
+
+        self.road_name = road_name
+        self.fps = fps
+        self.out_dir = out_dir
+        self.max_pending = max_pending
+
+        # Ring buffer (allocated on first frame, once shape is known)
+        self.capacity = max(1, int(pre_seconds * fps))
+        self.ring = None
+        self.ring_index = 0
+        self.ring_count = 0
+
+        # Recording state
+        self.recording = False
+        self.post_frames = max(1, int(post_seconds * fps))
+        self.post_frames_left = 0
+        self.dropped_frames = 0
+
+        # Background encoder
+        self.jobs = queue.Queue()
+        self.encoder = threading.Thread(target=self._encode_loop, daemon=True)
+        self.encoder.start()
+
+    # Detection Loop Side
+
+    def push(self, frame, alert_active):
+
+        if frame is None:
+            return
+
+        if self.ring is None:
+            self.ring = np.empty((self.capacity,) + frame.shape, dtype=np.uint8)
+
+        if alert_active and not self.recording:
+            self._start_clip(frame)
+
+        if self.recording:
+            self._send_frame(frame)
+
+            if alert_active:
+                self.post_frames_left = self.post_frames
+            else:
+                self.post_frames_left -= 1
+                if self.post_frames_left <= 0:
+                    self.jobs.put(("close", None))
+                    self.recording = False
+
+        # Always keep the ring current for the next pre-roll
+        self.ring[self.ring_index] = frame
+        self.ring_index = (self.ring_index + 1) % self.capacity
+        self.ring_count = min(self.ring_count + 1, self.capacity)
+
+    def _start_clip(self, frame):
+
+        stamp = time.strftime("%Y%m%d_%H%M%S")
+        path = os.path.join(self.out_dir, f"{self.road_name}_{stamp}.mp4")
+        height, width = frame.shape[:2]
+
+        self.jobs.put(("open", (path, (width, height))))
+
+        # Oldest-first copy of the pre-roll (the ring keeps being overwritten)
+        if self.ring_count == self.capacity:
+            preroll = np.concatenate(
+                (self.ring[self.ring_index:], self.ring[:self.ring_index])
+            )
+        else:
+            preroll = self.ring[:self.ring_count].copy()
+
+        self.jobs.put(("frames", preroll))
+        self.recording = True
+
+        print(f"[INFO] {self.road_name}: recording clip → {path}")
+
+    def _send_frame(self, frame):
+
+        if self.jobs.qsize() >= self.max_pending:
+            self.dropped_frames += 1
+            return
+
+        # Copy: the caller may draw on or reuse the frame after push()
+        self.jobs.put(("frames", frame[np.newaxis].copy()))
+
+    def close(self):
+
+        if self.recording:
+            self.jobs.put(("close", None))
+            self.recording = False
+
+        self.jobs.put(None)
+        self.encoder.join()
+
+        if self.dropped_frames:
+            print(f"[WARN] {self.road_name}: {self.dropped_frames} clip frames dropped")
+
+    # Encoder Thread Side
+
+    def _encode_loop(self):
+
+        writer = None
+
+        while True:
+
+            job = self.jobs.get()
+            if job is None:
+                break
+
+            kind, payload = job
+
+            if kind == "open":
+                path, size = payload
+                fourcc = cv2.VideoWriter_fourcc(*"mp4v")
+                writer = cv2.VideoWriter(path, fourcc, self.fps, size)
+
+            elif kind == "frames" and writer is not None:
+                for frame in payload:
+                    writer.write(frame)
+
+            elif kind == "close" and writer is not None:
+                writer.release()
+                writer = None
+
+        if writer is not None:
+            writer.release()
@@ -0,0 +1,369 @@
+import csv
+import json
+import os
+
+import numpy as np
+
+
+# One log row in compact binary form (21 bytes vs ~60 in CSV)
+ROW_DTYPE = np.dtype([
+    ("timestamp", "<f8"),
+    ("alert", "u1"),
+    ("vehicle_count", "<i4"),
+    ("min_distance", "<f4"),
+    ("speed", "<f4")
+])
+
+# Fixed histogram bins keep memory bounded regardless of log size
+DISTANCE_BINS = np.arange(0, 210, 10, dtype=np.float64)
+SPEED_BINS = np.array([0, 0.5, 1, 2, 4, 8, 16, np.inf])
+DURATION_BINS = np.array([0, 1, 2, 5, 10, 30, 60, 300, np.inf])
+
+
+# Chunked CSV Reader
+
+def read_log_chunks(filename, chunk_rows=200000):
+    """
+    Stream logs/run_log.csv as {road: structured array} chunks.
+    Only one chunk is held in memory at a time.
+    """
+
+    with open(filename, newline="") as f:
+
+        reader = csv.reader(f)
+        next(reader, None)  # header
+
+        rows = {}
+        pending = 0
+
+        for row in reader:
+
+            if len(row) < 6:
+                continue
+
+            rows.setdefault(row[1], []).append((
+                float(row[0]),
+                row[2] == "True",
+                int(float(row[3])),
+                float(row[4]),
+                float(row[5])
+            ))
+            pending += 1
+
+            if pending >= chunk_rows:
+                yield _to_arrays(rows)
+                rows = {}
+                pending = 0
+
+        if rows:
+            yield _to_arrays(rows)
+
+
+def _to_arrays(rows):
+
+    return {road: np.array(r, dtype=ROW_DTYPE) for road, r in rows.items()}
+
+
+# Per-Road Streaming Statistics
+
+class RoadStats:
+    """
+    Incremental per-road summary:
+    - alert count (rising edges) + alert duration histogram
+    - min_distance / speed histograms
+    - time-bucketed rows / alert rows / max vehicles / closest distance
+    """
+
+    def __init__(self, road, bucket_seconds=60):
+
+        self.road = road
+        self.bucket_seconds = bucket_seconds
+
+        self.rows = 0
+        self.alert_rows = 0
+        self.alert_count = 0
+        self.first_ts = None
+        self.last_ts = None
+
+        self.prev_alert = 0
+        self.onset_ts = None
+        self.duration_total = 0.0
+        self.duration_max = 0.0
+        self.duration_hist = np.zeros(len(DURATION_BINS) - 1, dtype=np.int64)
+
+        self.distance_hist = np.zeros(len(DISTANCE_BINS) - 1, dtype=np.int64)
+        self.speed_hist = np.zeros(len(SPEED_BINS) - 1, dtype=np.int64)
+        self.speed_max = 0.0
+
+        # bucket -> [rows, alert_rows, max_vehicles, min_distance]
+        self.buckets = {}
+
+    def update(self, chunk):
+
+        if len(chunk) == 0:
+            return
+
+        ts = chunk["timestamp"]
+        alert = chunk["alert"]
+
+        if self.first_ts is None:
+            self.first_ts = float(ts[0])
+
+        self.rows += len(chunk)
+        self.alert_rows += int(alert.sum())
+
+        self._update_alerts(ts, alert)
+
+        self.distance_hist += np.histogram(
+            np.clip(chunk["min_distance"], 0, 200), DISTANCE_BINS
+        )[0]
+        self.speed_hist += np.histogram(chunk["speed"], SPEED_BINS)[0]
+        self.speed_max = max(self.speed_max, float(chunk["speed"].max()))
+
+        self._update_buckets(chunk)
+
+        self.last_ts = float(ts[-1])
+
+    def _update_alerts(self, ts, alert):
+
+        # Carry the previous chunk's last state across the boundary
+        edges = np.diff(alert.astype(np.int8), prepend=np.int8(self.prev_alert))
+
+        for i in np.flatnonzero(edges):
+
+            if edges[i] > 0:
+                self.alert_count += 1
+                self.onset_ts = float(ts[i])
+
+            elif self.onset_ts is not None:
+                self._add_duration(float(ts[i]) - self.onset_ts)
+                self.onset_ts = None
+
+        self.prev_alert = int(alert[-1])
+
+    def _add_duration(self, duration):
+
+        self.duration_total += duration
+        self.duration_max = max(self.duration_max, duration)
+        self.duration_hist += np.histogram([duration], DURATION_BINS)[0]
+
+    def _update_buckets(self, chunk):
+
+        keys = (chunk["timestamp"] // self.bucket_seconds).astype(np.int64)
+
+        # Group rows by bucket (log order is normally already sorted)
+        order = np.argsort(keys, kind="stable")
+        keys = keys[order]
+        chunk = chunk[order]
+
+        uniq, starts = np.unique(keys, return_index=True)
+        ends = np.append(starts[1:], len(keys))
+
+        for key, s, e in zip(uniq, starts, ends):
+
+            part = chunk[s:e]
+            bucket = self.buckets.setdefault(int(key), [0, 0, 0, 200.0])
+            bucket[0] += len(part)
+            bucket[1] += int(part["alert"].sum())
+            bucket[2] = max(bucket[2], int(part["vehicle_count"].max()))
+            bucket[3] = min(bucket[3], float(part["min_distance"].min()))
+
+    def finish(self):
+
+        # An alert still active at end of log counts up to the last row
+        if self.prev_alert and self.onset_ts is not None:
+            self._add_duration(self.last_ts - self.onset_ts)
+            self.onset_ts = None
+
+
+def approx_percentile(hist, bins, q, max_value=None):
+
+    total = hist.sum()
+    if total == 0:
+        return 0.0
+
+    # Upper edge of the bin holding the q-th value; the open-ended last
+    # bin falls back to its lower edge, and the result never exceeds
+    # the observed maximum
+    idx = min(int(np.searchsorted(np.cumsum(hist), q * total)), len(hist) - 1)
+    value = float(bins[idx + 1])
+    if not np.isfinite(value):
+        value = float(bins[idx])
+    if max_value is not None:
+        value = min(value, max_value)
+
+    return value
+
+
+def summarize_chunks(chunks, bucket_seconds=60):
+
+    stats = {}
+
+    for chunk in chunks:
+        for road, rows in chunk.items():
+            if road not in stats:
+                stats[road] = RoadStats(road, bucket_seconds)
+            stats[road].update(rows)
+
+    for road_stats in stats.values():
+        road_stats.finish()
+
+    return stats
+
+
+# Indexed Columnar Store
+
+class LogColumnStore:
+    """
+    Per-road, per-field binary column files + JSON index.
+
+    Layout: <directory>/<road>/<field>.bin, one flat array per ROW_DTYPE
+    field, so a query only pages in the columns it reads. The index
+    records each field's dtype and each road's row count and timestamp
+    range. Rows are appended in log order, so timestamps are sorted per
+    road and a time-range query is two binary searches on one column.
+    """
+
+    INDEX_NAME = "index.json"
+    FIELDS = ROW_DTYPE.names
+
+    def __init__(self, directory):
+
+        self.directory = directory
+        self.index_path = os.path.join(directory, self.INDEX_NAME)
+        self._index = None
+
+    def _field_path(self, road, field):
+
+        return os.path.join(self.directory, road, f"{field}.bin")
+
+    def convert(self, chunks):
+
+        os.makedirs(self.directory, exist_ok=True)
+
+        roads = {}
+        files = {}
+
+        try:
+            for chunk in chunks:
+                for road, rows in chunk.items():
+
+                    if road not in files:
+                        os.makedirs(os.path.join(self.directory, road), exist_ok=True)
+                        files[road] = {
+                            field: open(self._field_path(road, field), "wb")
+                            for field in self.FIELDS
+                        }
+                        roads[road] = {"rows": 0, "ts_min": None, "ts_max": None}
+
+                    if len(rows) == 0:
+                        continue
+
+                    for field in self.FIELDS:
+                        np.ascontiguousarray(rows[field]).tofile(files[road][field])
+
+                    info = roads[road]
+                    ts = rows["timestamp"]
+                    info["rows"] += len(rows)
+                    lo, hi = float(ts.min()), float(ts.max())
+                    info["ts_min"] = lo if info["ts_min"] is None else min(info["ts_min"], lo)
+                    info["ts_max"] = hi if info["ts_max"] is None else max(info["ts_max"], hi)
+        finally:
+            for road_files in files.values():
+                for f in road_files.values():
+                    f.close()
+
+        # Index written last: a half-converted store has no index
+        index = {
+            "fields": {field: ROW_DTYPE[field].str for field in self.FIELDS},
+            "roads": roads
+        }
+        with open(self.index_path, "w") as f:
+            json.dump(index, f, indent=2)
+        self._index = index
+
+        return {road: info["rows"] for road, info in roads.items()}
+
+    def index(self):
+
+        if self._index is None:
+
+            if not os.path.exists(self.index_path):
+                raise ValueError(f"no column store index at {self.index_path}")
+
+            with open(self.index_path) as f:
+                index = json.load(f)
+
+            expected = {field: ROW_DTYPE[field].str for field in self.FIELDS}
+            if index.get("fields") != expected:
+                raise ValueError(
+                    f"column store {self.directory} has an unexpected layout"
+                    " (re-run convert)"
+                )
+            self._index = index
+
+        return self._index
+
+    def roads(self):
+
+        return {road: info["rows"] for road, info in self.index()["roads"].items()}
+
+    def road_info(self, road):
+
+        roads = self.index()["roads"]
+        if road not in roads:
+            raise ValueError(
+                f"unknown road {road!r} (available: {', '.join(sorted(roads)) or 'none'})"
+            )
+        return roads[road]
+
+    def open_column(self, road, field):
+
+        rows = self.road_info(road)["rows"]
+        dtype = np.dtype(self.index()["fields"][field])
+
+        if rows == 0:
+            return np.zeros(0, dtype=dtype)
+
+        return np.memmap(
+            self._field_path(road, field), dtype=dtype, mode="r", shape=(rows,)
+        )
+
+    def query(self, road, start=None, end=None, fields=None):
+        """
+        {field: memmap slice} for rows with start <= timestamp <= end.
+        """
+
+        fields = fields or self.FIELDS
+        info = self.road_info(road)
+
+        # Range entirely outside the road's data: no column is opened
+        if info["rows"] == 0 or (
+            (start is not None and start > info["ts_max"])
+            or (end is not None and end < info["ts_min"])
+        ):
+            return {
+                field: np.zeros(0, dtype=self.index()["fields"][field])
+                for field in fields
+            }
+
+        ts = self.open_column(road, "timestamp")
+        lo = 0 if start is None else int(np.searchsorted(ts, start, "left"))
+        hi = len(ts) if end is None else int(np.searchsorted(ts, end, "right"))
+
+        return {field: self.open_column(road, field)[lo:hi] for field in fields}
+
+    def iter_chunks(self, road, start=None, end=None, chunk_rows=200000):
+        """
+        Re-assemble a queried range as ROW_DTYPE chunks for RoadStats.
+        """
+
+        columns = self.query(road, start, end)
+        rows = len(columns["timestamp"])
+
+        for i in range(0, rows, chunk_rows):
+            part = min(chunk_rows, rows - i)
+            chunk = np.empty(part, dtype=ROW_DTYPE)
+            for field in self.FIELDS:
+                chunk[field] = columns[field][i:i + part]
+            yield chunk
@@ -0,0 +1,145 @@
+import os
+
+import cv2
+import numpy as np
+
+from core.road_analyzer import RoadAnalyzer
+from core.startup import load_model
+
+
+# Per-frame output columns (one array each in the .npz file)
+COLUMNS = [
+    "frame",
+    "timestamp",
+    "alert",
+    "vehicle_count",
+    "min_distance",
+    "speed"
+]
+
+
+# Segment Planning
+
+def plan_segments(road, video_path, segments, overlap_seconds):
+    """
+    Split one video into contiguous frame ranges.
+
+    Each segment (except the first) starts overlap_seconds early:
+    those warm-up frames rebuild ByteTrack tracks, approach counters
+    and alert hold state, so the segment boundary is stitched
+    without carrying state across processes. Warm-up frames are
+    processed but not emitted.
+    """
+
+    cap = cv2.VideoCapture(video_path)
+    frame_total = int(cap.get(cv2.CAP_PROP_FRAME_COUNT))
+    fps = cap.get(cv2.CAP_PROP_FPS) or 30.0
+    cap.release()
+
+    if frame_total <= 0:
+        return []
+
+    segments = max(1, min(segments, frame_total))
+    overlap = int(round(overlap_seconds * fps))
+    bounds = np.linspace(0, frame_total, segments + 1).astype(int)
+
+    tasks = []
+    for start, end in zip(bounds[:-1], bounds[1:]):
+        tasks.append({
+            "road": road,
+            "video_path": video_path,
+            "start": int(start),
+            "end": int(end),
+            "warmup_start": max(0, int(start) - overlap),
+            "fps": fps
+        })
+
+    return tasks
+
+
+# Worker Process
+
+_worker_model = None
+
+
+def init_worker(weights, torch_threads):
+
+    global _worker_model
+
+    # Split cores between workers instead of every process using all of them
+    _worker_model = load_model(weights, intra_threads=torch_threads)
+
+
+def _reset_tracker(model):
+
+    predictor = getattr(model, "predictor", None)
+    for tracker in getattr(predictor, "trackers", []):
+        tracker.reset()
+
+
+def process_segment(task):
+
+    _reset_tracker(_worker_model)
+
+    cap = cv2.VideoCapture(task["video_path"])
+    cap.set(cv2.CAP_PROP_POS_FRAMES, task["warmup_start"])
+
+    analyzer = RoadAnalyzer(
+        task["road"], task["video_path"], _worker_model, cap=cap
+    )
+
+    # Alert hold runs on video time, not wall time
+    fps = task["fps"]
+    frame_index = task["warmup_start"]
+    analyzer.clock = lambda: frame_index / fps
+
+    rows = {name: [] for name in COLUMNS}
+
+    while frame_index < task["end"]:
+
+        if analyzer.process_frame() is None:
+            break
+
+        if frame_index >= task["start"]:
+            status = analyzer.get_status()
+            rows["frame"].append(frame_index)
+            rows["timestamp"].append(frame_index / fps)
+            rows["alert"].append(status["alert"])
+            rows["vehicle_count"].append(status["vehicle_count"])
+            rows["min_distance"].append(status["min_distance"])
+            rows["speed"].append(status["speed"])
+
+        frame_index += 1
+
+    cap.release()
+
+    return task["road"], task["start"], _to_columns(rows)
+
+
+# Columnar Output
+
+def _to_columns(rows):
+
+    return {
+        "frame": np.asarray(rows["frame"], dtype=np.int64),
+        "timestamp": np.asarray(rows["timestamp"], dtype=np.float64),
+        "alert": np.asarray(rows["alert"], dtype=bool),
+        "vehicle_count": np.asarray(rows["vehicle_count"], dtype=np.int32),
+        "min_distance": np.asarray(rows["min_distance"], dtype=np.float32),
+        "speed": np.asarray(rows["speed"], dtype=np.float32)
+    }
+
+
+def stitch_segments(segment_results):
+
+    ordered = sorted(segment_results, key=lambda r: r[0])
+    return {
+        name: np.concatenate([columns[name] for _, columns in ordered])
+        for name in COLUMNS
+    }
+
+
+def save_columns(filename, columns):
+
+    os.makedirs(os.path.dirname(filename) or ".", exist_ok=True)
+    np.savez(filename, **columns)
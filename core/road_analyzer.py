@@ -1,7 +1,63 @@
 import cv2
+import numpy as np
 import time
 
 
+# Box Merging (far-field + full-frame detections)
+
+def merge_detections(near, far, iou_threshold=0.5):
+    """
+    Greedy NMS over rows of [x1, y1, x2, y2, conf, cls]:
+    a vehicle seen at both scales keeps its higher-confidence box.
+    """
+
+    boxes = np.concatenate((near, far)).astype(np.float32)
+    if len(boxes) == 0:
+        return boxes.reshape(0, 6)
+
+    order = np.argsort(-boxes[:, 4])
+    areas = (boxes[:, 2] - boxes[:, 0]) * (boxes[:, 3] - boxes[:, 1])
+    keep = []
+
+    while len(order):
+
+        i = order[0]
+        keep.append(i)
+        rest = order[1:]
+
+        ix1 = np.maximum(boxes[i, 0], boxes[rest, 0])
+        iy1 = np.maximum(boxes[i, 1], boxes[rest, 1])
+        ix2 = np.minimum(boxes[i, 2], boxes[rest, 2])
+        iy2 = np.minimum(boxes[i, 3], boxes[rest, 3])
+        inter = np.clip(ix2 - ix1, 0, None) * np.clip(iy2 - iy1, 0, None)
+        iou = inter / (areas[i] + areas[rest] - inter + 1e-6)
+
+        order = rest[iou < iou_threshold]
+
+    return boxes[keep]
+
+
+def box_iou(a, b):
+
+    ix = max(0, min(a[2], b[2]) - max(a[0], b[0]))
+    iy = max(0, min(a[3], b[3]) - max(a[1], b[1]))
+    inter = ix * iy
+    union = (a[2] - a[0]) * (a[3] - a[1]) + (b[2] - b[0]) * (b[3] - b[1]) - inter
+
+    return inter / union if union > 0 else 0.0
+
+
+def create_tracker(frame_rate):
+
+    # Same ByteTrack settings model.track() uses, but owned by one road
+    from ultralytics.trackers.byte_tracker import BYTETracker
+    from ultralytics.utils import IterableSimpleNamespace, yaml_load
+    from ultralytics.utils.checks import check_yaml
+
+    cfg = IterableSimpleNamespace(**yaml_load(check_yaml("bytetrack.yaml")))
+    return BYTETracker(cfg, frame_rate=max(1, int(round(frame_rate))))
+
+
 class RoadAnalyzer:
     """
     FINAL Road Analyzer (Paper Complete)
@@ -16,10 +72,14 @@ class RoadAnalyzer:
     Frame skipping for speed
     """
 
-    def __init__(self, road_name, video_path, shared_model):
+    DEFAULT_INPUT_SIZE = (480, 320)
+
+    def __init__(self, road_name, video_path, shared_model, cap=None):
 
         self.road_name = road_name
-        self.cap = cv2.VideoCapture(video_path)
+
+        # Capture may be opened ahead of time (parallel startup)
+        self.cap = cap if cap is not None else cv2.VideoCapture(video_path)
 
         # Shared YOLO model
         self.model = shared_model
@@ -30,20 +90,44 @@ class RoadAnalyzer:
         # Tracking memory
         self.bbox_history = {}
         self.approach_counter = {}
+        self.last_seen = {}
+        self.last_box = {}
+        self.current_ids = []
+
+        # Checkpointed tracks waiting to be matched to new track IDs
+        self.restored_tracks = []
+        self.restore_frames_left = 0
 
         # Alert smoothing
         self.alert_active = False
         self.last_alert_time = 0
 
+        # Time source for alert hold (offline runs use video time)
+        self.clock = time.time
+
         # Parameters (Demo-friendly)
         self.APPROACH_FRAMES_REQUIRED = 2
         self.ALERT_HOLD_TIME = 6.0
+        self.TRACK_FORGET_FRAMES = 90  # drop IDs unseen this long
+        self.RESTORE_IOU = 0.3         # box overlap to adopt a restored track
+        self.RESTORE_FRAMES = 3        # frames to keep trying after restart
 
         # Outputs
         self.vehicle_count = 0
         self.min_distance = 200
         self.speed_score = 0
 
+        # Inference settings (see autotune.py)
+        self.input_size = self.DEFAULT_INPUT_SIZE
+        self.imgsz = None
+        self.conf = 0.4
+
+        # Far-field band (see enable_far_field), off by default
+        self.far_field_band = None
+        self.far_field_width = 960
+        self.detector = None
+        self.tracker = None
+
         # Performance boost
         self.frame_skip = 1
         self.frame_count = 0
@@ -60,6 +144,14 @@ class RoadAnalyzer:
         return max(10, min(200, dist))
 
     
+    # Effective Frame Rate (source rate after frame skipping)
+
+    def effective_fps(self):
+
+        source_fps = self.cap.get(cv2.CAP_PROP_FPS) or 30.0
+        return source_fps / self.frame_skip
+
+    
     # Speed Trend Estimation
     
     def estimate_speed(self, current_h, prev_h):
@@ -69,6 +161,118 @@ class RoadAnalyzer:
         return max(0, (current_h - prev_h) / 5)
 
     
+    # YOLO Detection + Tracking
+
+    def track(self, frame):
+
+        extra = {"imgsz": self.imgsz} if self.imgsz else {}
+
+        return self.model.track(
+            frame,
+            persist=True,
+            tracker="bytetrack.yaml",
+            conf=self.conf,
+            classes=self.vehicle_classes,
+            **extra
+        )
+
+    
+    def tracked_boxes(self, results):
+
+        tracked = []
+
+        if results and results[0].boxes is not None:
+            for box in results[0].boxes:
+                if box.id is None:
+                    continue
+                x1, y1, x2, y2 = map(int, box.xyxy[0])
+                tracked.append((int(box.id.item()), x1, y1, x2, y2))
+
+        return tracked
+
+    
+    # Multi-Resolution Far-Field Detection
+
+    def enable_far_field(self, band, detector, width=960):
+        """
+        band: (top, bottom) fractions of frame height around the horizon.
+        detector: a YOLO model never used for .track() (tracking registers
+        callbacks that would filter its plain predictions).
+        width: crop width for the high-resolution band.
+        """
+
+        self.far_field_band = band
+        self.far_field_width = width
+        self.detector = detector
+
+    def detect(self, image, imgsz=None):
+
+        extra = {"imgsz": imgsz} if imgsz else {}
+
+        results = self.detector.predict(
+            image,
+            conf=self.conf,
+            classes=self.vehicle_classes,
+            verbose=False,
+            **extra
+        )
+        return results[0].boxes.data.cpu().numpy()
+
+    def far_field_crop(self, raw_frame):
+
+        raw_h, raw_w = raw_frame.shape[:2]
+        top = int(self.far_field_band[0] * raw_h)
+        bottom = int(self.far_field_band[1] * raw_h)
+
+        crop = raw_frame[top:bottom]
+        scale = min(1.0, self.far_field_width / raw_w)
+        if scale < 1.0:
+            crop = cv2.resize(crop, (int(raw_w * scale), int((bottom - top) * scale)))
+
+        return crop, top, scale
+
+    def track_multiscale(self, raw_frame, frame):
+
+        raw_h, raw_w = raw_frame.shape[:2]
+        width, height = self.input_size
+
+        # Scale 1: whole frame at low resolution
+        near = self.detect(frame, self.imgsz)
+
+        # Scale 2: far-field band at high resolution, mapped to frame coords
+        crop, top, scale = self.far_field_crop(raw_frame)
+        far = self.detect(crop, int(np.ceil(crop.shape[1] / 32) * 32))
+        far[:, [0, 2]] *= width / (raw_w * scale)
+        far[:, [1, 3]] = (far[:, [1, 3]] / scale + top) * (height / raw_h)
+
+        detections = merge_detections(near, far)
+
+        if self.tracker is None:
+            self.tracker = create_tracker(self.effective_fps())
+
+        from ultralytics.engine.results import Boxes
+
+        tracks = self.tracker.update(Boxes(detections, frame.shape[:2]), frame)
+
+        return [
+            (int(t[4]), int(t[0]), int(t[1]), int(t[2]), int(t[3]))
+            for t in tracks
+        ]
+
+    
+    # Warm-up (one-off model / tracker init on a dummy frame)
+
+    def warm_up(self):
+
+        width, height = self.input_size
+        dummy = np.zeros((height, width, 3), dtype=np.uint8)
+
+        if self.far_field_band is not None:
+            self.track_multiscale(dummy, dummy)
+        else:
+            self.track(dummy)
+
+    
     # Main Frame Processing
     
     def process_frame(self):
@@ -76,14 +280,19 @@ class RoadAnalyzer:
         # Frame skipping for faster execution
         self.frame_count += 1
         if self.frame_count % self.frame_skip != 0:
+            self.cap.grab()  # drop the frame without decoding it
             return None
 
         ret, frame = self.cap.read()
         if not ret:
             return None
 
-        frame = cv2.resize(frame, (480, 320))
-        current_time = time.time()
+        raw_frame = frame
+        if frame.shape[1::-1] != tuple(self.input_size):
+            frame = cv2.resize(frame, self.input_size)
+        elif not frame.flags.writeable:
+            frame = frame.copy()  # cached frames are read-only views
+        current_time = self.clock()
 
         approach_detected = False
         vehicle_count = 0
@@ -91,103 +300,101 @@ class RoadAnalyzer:
         max_speed = 0
 
         # YOLO Detection + Tracking
-        results = self.model.track(
-            frame,
-            persist=True,
-            tracker="bytetrack.yaml",
-            conf=0.4,
-            classes=self.vehicle_classes
-        )
+        if self.far_field_band is not None:
+            tracked = self.track_multiscale(raw_frame, frame)
+        else:
+            tracked = self.tracked_boxes(self.track(frame))
 
-        if results and results[0].boxes is not None:
+        if self.restored_tracks:
+            self.adopt_restored_tracks(tracked)
 
-            for box in results[0].boxes:
+        self.current_ids = [t[0] for t in tracked]
 
-                if box.id is None:
-                    continue
+        for track_id, x1, y1, x2, y2 in tracked:
 
-                track_id = int(box.id.item())
+            # Bounding box
+            bbox_height = y2 - y1
 
-                # Bounding box
-                x1, y1, x2, y2 = map(int, box.xyxy[0])
-                bbox_height = y2 - y1
+            vehicle_count += 1
+            self.last_seen[track_id] = self.frame_count
+            self.last_box[track_id] = (x1, y1, x2, y2)
 
-                vehicle_count += 1
+            # Initialize memory
+            if track_id not in self.bbox_history:
+                self.bbox_history[track_id] = bbox_height
+                self.approach_counter[track_id] = 0
+                continue
 
-                # Initialize memory
-                if track_id not in self.bbox_history:
-                    self.bbox_history[track_id] = bbox_height
-                    self.approach_counter[track_id] = 0
-                    continue
+            prev_h = self.bbox_history[track_id]
 
-                prev_h = self.bbox_history[track_id]
+            # Temporal persistence approach validation
+            if bbox_height > prev_h + 3:
+                self.approach_counter[track_id] += 1
+            else:
+                self.approach_counter[track_id] = max(
+                    0, self.approach_counter[track_id] - 1
+                )
 
-                # Temporal persistence approach validation
-                if bbox_height > prev_h + 3:
-                    self.approach_counter[track_id] += 1
-                else:
-                    self.approach_counter[track_id] = max(
-                        0, self.approach_counter[track_id] - 1
-                    )
+            # Approaching decision
+            is_approaching = (
+                self.approach_counter[track_id] >= self.APPROACH_FRAMES_REQUIRED
+            )
 
-                # Approaching decision
-                is_approaching = (
-                    self.approach_counter[track_id] >= self.APPROACH_FRAMES_REQUIRED
-                )
+            # Distance + Speed only for approaching vehicles
+            if is_approaching:
 
-                # Distance + Speed only for approaching vehicles
-                if is_approaching:
-
-                    # Distance estimation
-                    dist = self.estimate_distance(bbox_height)
-                    min_distance = min(min_distance, dist)
-
-                    # Speed estimation
-                    speed = self.estimate_speed(bbox_height, prev_h)
-                    max_speed = max(max_speed, speed)
-
-                    # Clear WARNING trigger for demo
-                    if dist < 195:
-                        approach_detected = True
-
-                    # Overlay Distance + Speed
-                    cv2.putText(
-                        frame,
-                        f"D:{int(dist)}m",
-                        (x1, y2 + 20),
-                        cv2.FONT_HERSHEY_SIMPLEX,
-                        0.55,
-                        (255, 255, 255),
-                        2
-                    )
-
-                    cv2.putText(
-                        frame,
-                        f"S:{speed:.2f}",
-                        (x1, y2 + 40),
-                        cv2.FONT_HERSHEY_SIMPLEX,
-                        0.55,
-                        (255, 255, 255),
-                        2
-                    )
-
-                # Update bbox history
-                self.bbox_history[track_id] = bbox_height
+                # Distance estimation
+                dist = self.estimate_distance(bbox_height)
+                min_distance = min(min_distance, dist)
+
+                # Speed estimation
+                speed = self.estimate_speed(bbox_height, prev_h)
+                max_speed = max(max_speed, speed)
 
-                # Draw bounding box + ID
-                color = (0, 255, 255) if is_approaching else (0, 255, 0)
+                # Clear WARNING trigger for demo
+                if dist < 195:
+                    approach_detected = True
+
+                # Overlay Distance + Speed
+                cv2.putText(
+                    frame,
+                    f"D:{int(dist)}m",
+                    (x1, y2 + 20),
+                    cv2.FONT_HERSHEY_SIMPLEX,
+                    0.55,
+                    (255, 255, 255),
+                    2
+                )
 
-                cv2.rectangle(frame, (x1, y1), (x2, y2), color, 2)
                 cv2.putText(
                     frame,
-                    f"ID:{track_id}",
-                    (x1, y1 - 5),
+                    f"S:{speed:.2f}",
+                    (x1, y2 + 40),
                     cv2.FONT_HERSHEY_SIMPLEX,
-                    0.5,
-                    color,
+                    0.55,
+                    (255, 255, 255),
                     2
                 )
 
+            # Update bbox history
+            self.bbox_history[track_id] = bbox_height
+
+            # Draw bounding box + ID
+            color = (0, 255, 255) if is_approaching else (0, 255, 0)
+
+            cv2.rectangle(frame, (x1, y1), (x2, y2), color, 2)
+            cv2.putText(
+                frame,
+                f"ID:{track_id}",
+                (x1, y1 - 5),
+                cv2.FONT_HERSHEY_SIMPLEX,
+                0.5,
+                color,
+                2
+            )
+
+        self.forget_stale_tracks()
+
         # Alert smoothing (hold time)
         if approach_detected:
             self.alert_active = True
@@ -203,6 +410,78 @@ class RoadAnalyzer:
         return frame
 
     
+    # Prune IDs that have left the scene (keeps memory bounded)
+
+    def forget_stale_tracks(self):
+
+        cutoff = self.frame_count - self.TRACK_FORGET_FRAMES
+        stale = [tid for tid, seen in self.last_seen.items() if seen < cutoff]
+
+        for track_id in stale:
+            del self.last_seen[track_id]
+            self.bbox_history.pop(track_id, None)
+            self.approach_counter.pop(track_id, None)
+            self.last_box.pop(track_id, None)
+
+    
+    # Checkpoint State (warm restart)
+    
+    def export_state(self):
+
+        # Tracks in the latest frame: box + approach counter. Track IDs are
+        # not saved (the tracker renumbers from 1 after a restart); restored
+        # tracks are matched to new IDs by box overlap instead.
+        tracks = [
+            list(self.last_box[tid]) + [self.approach_counter.get(tid, 0)]
+            for tid in self.current_ids
+            if tid in self.last_box
+        ]
+
+        return {
+            "alert_active": self.alert_active,
+            "last_alert_time": self.last_alert_time,
+            "tracks": tracks
+        }
+
+    def restore_state(self, state):
+
+        self.alert_active = state["alert_active"]
+        self.last_alert_time = state["last_alert_time"]
+        self.restored_tracks = state.get("tracks", [])
+        self.restore_frames_left = self.RESTORE_FRAMES
+
+    def adopt_restored_tracks(self, tracked):
+
+        # Greedy best-IoU matching of new, unseen track IDs to restored boxes
+        pairs = []
+        for track_id, x1, y1, x2, y2 in tracked:
+            if track_id in self.bbox_history:
+                continue
+            for i, old in enumerate(self.restored_tracks):
+                iou = box_iou((x1, y1, x2, y2), old[:4])
+                if iou >= self.RESTORE_IOU:
+                    pairs.append((iou, track_id, i))
+
+        used_ids, used_old = set(), set()
+        for iou, track_id, i in sorted(pairs, reverse=True):
+            if track_id in used_ids or i in used_old:
+                continue
+            used_ids.add(track_id)
+            used_old.add(i)
+
+            old = self.restored_tracks[i]
+            self.bbox_history[track_id] = old[3] - old[1]
+            self.approach_counter[track_id] = old[4]
+
+        self.restored_tracks = [
+            old for i, old in enumerate(self.restored_tracks) if i not in used_old
+        ]
+
+        self.restore_frames_left -= 1
+        if self.restore_frames_left <= 0:
+            self.restored_tracks = []
+
+    
     # Road Status Output
     
     def get_status(self):
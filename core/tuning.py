@@ -0,0 +1,217 @@
+import json
+import os
+import queue
+import time
+
+import cv2
+import numpy as np
+
+from core.frame_cache import FrameCache
+from core.road_analyzer import RoadAnalyzer
+from core.startup import load_model
+
+
+# Fixed cv2.waitKey() delay at the end of every main.py loop
+MAIN_LOOP_WAIT_MS = 10
+
+
+# Benchmark Worker (same layout as main.py: one process, roads round-robin)
+
+def open_capture(clip, task):
+
+    if task.get("frame_cache"):
+        return FrameCache(clip, task["input_size"], task["frame_cache"]).capture()
+    return cv2.VideoCapture(clip)
+
+
+def benchmark_worker(task, results):
+
+    # Report failures instead of dying silently, so the parent never waits
+    try:
+        results.put(("ok", measure_latencies(task)))
+    except Exception as e:
+        results.put(("error", f"{type(e).__name__}: {e}"))
+        raise
+
+
+def measure_latencies(task):
+
+    model = load_model(
+        task["weights"], task["intra_threads"], task["inter_threads"]
+    )
+
+    # Every sample clip is one road sharing the model, as in main.py
+    analyzers = []
+    for i, clip in enumerate(task["clips"]):
+        cap = open_capture(clip, task)
+        if not cap.isOpened():
+            raise RuntimeError(f"cannot open clip {clip}")
+        analyzer = RoadAnalyzer(f"BENCH{i}", clip, model, cap=cap)
+        apply_inference_settings(analyzer, task)
+        analyzers.append(analyzer)
+
+    analyzers[0].warm_up()
+
+    # Frames decoded per road since its last rewind
+    since_rewind = [0] * len(analyzers)
+
+    latencies = []
+    while len(latencies) < task["frames"]:
+
+        for i, analyzer in enumerate(analyzers):
+
+            started = time.perf_counter()
+            frame = analyzer.process_frame()
+            elapsed = time.perf_counter() - started
+
+            if frame is None:
+                if since_rewind[i] == 0:
+                    raise RuntimeError(f"no frames decoded from {task['clips'][i]}")
+                analyzer.cap.set(cv2.CAP_PROP_POS_FRAMES, 0)  # loop short clips
+                since_rewind[i] = 0
+                continue
+
+            since_rewind[i] += 1
+            latencies.append(elapsed)
+
+    for analyzer in analyzers:
+        analyzer.cap.release()
+
+    # Cached frames skip decode + resize; time them once and add them back
+    if task.get("frame_cache"):
+        decode = decode_resize_cost(task["clips"], task["input_size"], task["frames"])
+        latencies = [elapsed + decode for elapsed in latencies]
+
+    return latencies
+
+
+def decode_resize_cost(clips, size, frames):
+    """
+    Mean seconds per frame to decode and resize the clips straight from
+    video, the work a FrameCache takes out of process_frame().
+    """
+
+    size = tuple(size)
+    per_clip = max(1, frames // len(clips))
+    costs = []
+
+    for clip in clips:
+
+        cap = cv2.VideoCapture(clip)
+        for _ in range(per_clip):
+
+            started = time.perf_counter()
+            ret, frame = cap.read()
+            if not ret:
+                break
+            cv2.resize(frame, size)
+            costs.append(time.perf_counter() - started)
+
+        cap.release()
+
+    if not costs:
+        raise RuntimeError("no frames decoded while timing decode + resize")
+
+    return float(np.mean(costs))
+
+
+def run_benchmark(ctx, config, clips, frames, weights, frame_cache=None,
+                  timeout=600.0):
+
+    for clip in clips:
+        if not os.path.exists(clip):
+            raise RuntimeError(f"sample clip not found: {clip}")
+
+    # Build caches up front, outside the measured process
+    if frame_cache:
+        for clip in clips:
+            FrameCache(clip, config["input_size"], frame_cache).ensure()
+
+    # Fresh process per run: torch inter-op threads can only be set once
+    results = ctx.Queue()
+    task = dict(config, clips=clips, frames=frames,
+                weights=weights, frame_cache=frame_cache)
+    p = ctx.Process(target=benchmark_worker, args=(task, results))
+    p.start()
+
+    try:
+        status, payload = results.get(timeout=timeout)
+    except queue.Empty:
+        p.terminate()
+        p.join()
+        raise RuntimeError(
+            f"benchmark gave no result within {timeout:.0f}s"
+            f" (exit code {p.exitcode})"
+        )
+
+    p.join(timeout)
+    if p.is_alive():
+        p.terminate()
+        p.join()
+
+    if status != "ok":
+        raise RuntimeError(f"benchmark failed: {payload}")
+    if p.exitcode != 0:
+        raise RuntimeError(f"benchmark process exited with code {p.exitcode}")
+
+    return np.asarray(payload)
+
+
+# Capacity Model
+
+def roads_per_host(latencies, road_fps, target_p95, max_utilization=0.9,
+                   loop_wait=MAIN_LOOP_WAIT_MS / 1000.0):
+    """
+    How many roads the single main.py process can serve round-robin
+    at road_fps.
+
+    One loop processes every road once, then waits loop_wait in
+    cv2.waitKey().
+    Throughput: roads * mean + loop_wait fits in max_utilization / road_fps.
+    Latency: a road's frame may wait behind every other road's frame and
+    the key wait, so roads are added only while
+    p95 + (roads - 1) * mean + loop_wait < target.
+    """
+
+    mean = float(latencies.mean())
+    p95 = float(np.percentile(latencies, 95))
+
+    if p95 + loop_wait > target_p95:
+        return 0
+
+    by_throughput = int((max_utilization / road_fps - loop_wait) / mean)
+    by_latency = int((target_p95 - p95 - loop_wait) / mean) + 1
+
+    return max(0, min(by_throughput, by_latency))
+
+
+# Tuned Config (read by main.py)
+
+def apply_inference_settings(analyzer, config):
+
+    analyzer.input_size = tuple(config["input_size"])
+    analyzer.imgsz = config.get("imgsz")
+
+
+def apply_tuned_config(analyzer, config):
+
+    apply_inference_settings(analyzer, config)
+
+    source_fps = analyzer.cap.get(cv2.CAP_PROP_FPS) or 30.0
+    analyzer.frame_skip = max(1, round(source_fps / config["road_fps"]))
+
+
+def save_tuned_config(filename, config):
+
+    os.makedirs(os.path.dirname(filename) or ".", exist_ok=True)
+    with open(filename, "w") as f:
+        json.dump(config, f, indent=2)
+
+
+def load_tuned_config(filename):
+
+    if not os.path.exists(filename):
+        return None
+
+    with open(filename) as f:
+        return json.load(f)
@@ -0,0 +1,132 @@
+import argparse
+import time
+
+from core.log_stats import (
+    DISTANCE_BINS,
+    DURATION_BINS,
+    SPEED_BINS,
+    LogColumnStore,
+    approx_percentile,
+    read_log_chunks,
+    summarize_chunks
+)
+
+
+# Report Printing
+
+def print_histogram(title, hist, bins):
+
+    print(f"  {title}:")
+    for lo, hi, count in zip(bins[:-1], bins[1:], hist):
+        if count:
+            print(f"    {lo:>6g} – {hi:<6g} {count}")
+
+
+def print_report(stats, show_buckets=False):
+
+    for road in sorted(stats):
+
+        s = stats[road]
+        span = (s.last_ts - s.first_ts) if s.rows else 0
+        mean_duration = s.duration_total / s.alert_count if s.alert_count else 0
+        duration_p95 = approx_percentile(
+            s.duration_hist, DURATION_BINS, 0.95, s.duration_max
+        )
+        speed_p95 = approx_percentile(s.speed_hist, SPEED_BINS, 0.95, s.speed_max)
+
+        print(f"\n=== {road} ===")
+        print(f"  rows: {s.rows}   span: {span / 3600:.2f}h")
+        print(f"  alert rows: {s.alert_rows}   alerts: {s.alert_count}")
+        print(f"  alert duration: mean {mean_duration:.1f}s   max {s.duration_max:.1f}s"
+              f"   ~p95 {duration_p95:g}s")
+        print(f"  min_distance: ~p5 {approx_percentile(s.distance_hist, DISTANCE_BINS, 0.05):g}m"
+              f"   ~p50 {approx_percentile(s.distance_hist, DISTANCE_BINS, 0.5):g}m")
+        print(f"  speed: ~p95 {speed_p95:g}"
+              f"   max {s.speed_max:.2f}")
+
+        print_histogram("alert durations (s)", s.duration_hist, DURATION_BINS)
+        print_histogram("min_distance (m)", s.distance_hist, DISTANCE_BINS)
+        print_histogram("speed score", s.speed_hist, SPEED_BINS)
+
+        if show_buckets:
+            print(f"  buckets ({s.bucket_seconds}s): start, rows, alert rows,"
+                  " max vehicles, closest m")
+            for key in sorted(s.buckets):
+                rows, alert_rows, max_vehicles, closest = s.buckets[key]
+                start = time.strftime(
+                    "%Y-%m-%d %H:%M:%S", time.localtime(key * s.bucket_seconds)
+                )
+                print(f"    {start}  {rows:>7} {alert_rows:>7}"
+                      f" {max_vehicles:>4} {closest:>7.1f}")
+
+
+# Columnar Chunks (re-chunk the queried columns for the same stats code)
+
+def store_chunks(store, roads, start, end, chunk_rows):
+
+    for road in roads:
+        for chunk in store.iter_chunks(road, start, end, chunk_rows):
+            yield {road: chunk}
+
+
+def parse_args():
+
+    parser = argparse.ArgumentParser(
+        description="Bounded-memory analytics over CSVLogger run logs"
+    )
+    parser.add_argument("--chunk-rows", type=int, default=200000)
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    summary = sub.add_parser("summary", help="stream the CSV log and summarize")
+    summary.add_argument("log", nargs="?", default="logs/run_log.csv")
+    summary.add_argument("--bucket", type=int, default=60, help="bucket seconds")
+    summary.add_argument("--buckets", action="store_true", help="print buckets")
+
+    convert = sub.add_parser("convert", help="convert CSV log to column store")
+    convert.add_argument("log", nargs="?", default="logs/run_log.csv")
+    convert.add_argument("--out", default="logs/run_log.cols")
+
+    query = sub.add_parser("query", help="summarize a road/time range of a store")
+    query.add_argument("store", nargs="?", default="logs/run_log.cols")
+    query.add_argument("--road", action="append", help="road (repeatable)")
+    query.add_argument("--start", type=float, help="unix timestamp")
+    query.add_argument("--end", type=float, help="unix timestamp")
+    query.add_argument("--bucket", type=int, default=60, help="bucket seconds")
+    query.add_argument("--buckets", action="store_true", help="print buckets")
+
+    return parser.parse_args()
+
+
+def main():
+
+    args = parse_args()
+    started = time.perf_counter()
+
+    if args.command == "summary":
+        chunks = read_log_chunks(args.log, args.chunk_rows)
+        print_report(summarize_chunks(chunks, args.bucket), args.buckets)
+
+    elif args.command == "convert":
+        store = LogColumnStore(args.out)
+        counts = store.convert(read_log_chunks(args.log, args.chunk_rows))
+        for road, rows in sorted(counts.items()):
+            print(f"[INFO] {road}: {rows} rows")
+        print(f"[INFO] Column store written → {args.out}")
+
+    elif args.command == "query":
+        store = LogColumnStore(args.store)
+        try:
+            roads = args.road or sorted(store.roads())
+            for road in roads:
+                store.road_info(road)  # fail before any output
+        except ValueError as e:
+            print(f"\n[ERROR] {e}\n")
+            raise SystemExit(1)
+        chunks = store_chunks(store, roads, args.start, args.end, args.chunk_rows)
+        print_report(summarize_chunks(chunks, args.bucket), args.buckets)
+
+    print(f"\n[INFO] Done in {time.perf_counter() - started:.2f}s")
+
+
+if __name__ == "__main__":
+    main()
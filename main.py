@@ -1,18 +1,23 @@
+import time
+
 import cv2
-from ultralytics import YOLO
 
 from core.road_analyzer import RoadAnalyzer
+from core.startup import StartupTimer, fast_start, load_model
+from core.checkpoint import StateCheckpointer
+from core.clip_recorder import ClipRecorder
+from core.tuning import MAIN_LOOP_WAIT_MS, apply_tuned_config, load_tuned_config
 from ui.led_board import LedBoard
 from core.junction_controller import JunctionLogic
 from core.logger import CSVLogger
+from configs.junction_config import FAR_FIELD_BANDS
 
 
 def main():
 
     print("\n[INFO] Smart Junction Safety Alert System Started...\n")
 
-    # Load YOLO once
-    shared_model = YOLO("yolov8n.pt", verbose=False)
+    startup_timer = StartupTimer()
 
     # Junction type selection
     JUNCTION_TYPE = "Y_JUNCTION"   # FOUR_WAY / T_JUNCTION / Y_JUNCTION
@@ -20,30 +25,80 @@ def main():
 
     # Select road streams based on junction
     if JUNCTION_TYPE == "FOUR_WAY":
-        analyzers = [
-            RoadAnalyzer("NORTH", "videos/north.mp4", shared_model),
-            RoadAnalyzer("SOUTH", "videos/south.mp4", shared_model),
-            RoadAnalyzer("EAST", "videos/east.mp4", shared_model),
-            RoadAnalyzer("WEST", "videos/west.mp4", shared_model),
+        road_specs = [
+            ("NORTH", "videos/north.mp4"),
+            ("SOUTH", "videos/south.mp4"),
+            ("EAST", "videos/east.mp4"),
+            ("WEST", "videos/west.mp4"),
         ]
         blind_roads = ["NORTH", "SOUTH", "EAST", "WEST"]
 
     elif JUNCTION_TYPE == "T_JUNCTION":
-        analyzers = [
-            RoadAnalyzer("NORTH", "videos/north.mp4", shared_model),
-            RoadAnalyzer("EAST", "videos/east.mp4", shared_model),
-            RoadAnalyzer("WEST", "videos/west.mp4", shared_model),
+        road_specs = [
+            ("NORTH", "videos/north.mp4"),
+            ("EAST", "videos/east.mp4"),
+            ("WEST", "videos/west.mp4"),
         ]
         blind_roads = ["NORTH", "EAST", "WEST"]
 
     elif JUNCTION_TYPE == "Y_JUNCTION":
-        analyzers = [
-            RoadAnalyzer("LEFT", "videos/east.mp4", shared_model),
-            RoadAnalyzer("RIGHT", "videos/west.mp4", shared_model),
-            RoadAnalyzer("MAIN", "videos/highway.mp4", shared_model),
+        road_specs = [
+            ("LEFT", "videos/east.mp4"),
+            ("RIGHT", "videos/west.mp4"),
+            ("MAIN", "videos/highway.mp4"),
         ]
         blind_roads = ["LEFT", "RIGHT", "MAIN"]
 
+    # Host-specific inference settings (written by autotune.py)
+    tuned_config = load_tuned_config("configs/tuned_config.json") or {}
+    if tuned_config:
+        print("[INFO] Using tuned config → configs/tuned_config.json")
+
+    # Load YOLO once (in parallel with opening all camera streams)
+    shared_model, caps = fast_start(
+        road_specs,
+        startup_timer,
+        intra_threads=tuned_config.get("intra_threads"),
+        inter_threads=tuned_config.get("inter_threads")
+    )
+
+    analyzers = [
+        RoadAnalyzer(road, path, shared_model, cap=cap)
+        for (road, path), cap in zip(road_specs, caps)
+    ]
+
+    if tuned_config:
+        for analyzer in analyzers:
+            apply_tuned_config(analyzer, tuned_config)
+
+    # Far-field roads: separate detection-only model (no tracker callbacks)
+    far_field_roads = [a for a in analyzers if a.road_name in FAR_FIELD_BANDS]
+    if far_field_roads:
+        detector_started = time.perf_counter()
+        detector_model = load_model()
+        for analyzer in far_field_roads:
+            analyzer.enable_far_field(
+                FAR_FIELD_BANDS[analyzer.road_name], detector_model
+            )
+        startup_timer.record("far-field model", detector_started)
+
+    # Warm-up: pay one-off init cost before the first live frame
+    warm_started = time.perf_counter()
+    # (one road per detection path: shared model.track() and far-field)
+    shared_roads = [a for a in analyzers if a not in far_field_roads]
+    for road_group in (shared_roads, far_field_roads):
+        if road_group:
+            road_group[0].warm_up()
+    startup_timer.record("warm-up", warm_started)
+
+    # Alert clip recorders (pre-roll ring buffer + background encoder)
+    recorders = {
+        analyzer.road_name: ClipRecorder(
+            analyzer.road_name, fps=analyzer.effective_fps()
+        )
+        for analyzer in analyzers
+    }
+
     # LED dashboard
     led_board = LedBoard(JUNCTION_TYPE)
 
@@ -55,41 +110,64 @@ def main():
     print("[INFO] Logging Enabled → logs/run_log.csv")
     print("[INFO] Press 'q' or 'Esc' to quit.\n")
 
-    while True:
+    # Warm restart: restore recent alert-hold + track state
+    # (last, so the hold is extended by the full startup time)
+    checkpointer = StateCheckpointer(process_start=startup_timer.started_at)
+    checkpointer.restore(analyzers)
 
-        road_status_dict = {}
-        full_statuses = []
+    startup_timer.report()
 
-        for analyzer in analyzers:
+    # try/finally: a crash mid-alert must still finalize clips (mp4 index)
+    # and leave a fresh checkpoint for the warm restart
+    try:
+        while True:
+
+            road_status_dict = {}
+            full_statuses = []
+
+            for analyzer in analyzers:
 
-            frame = analyzer.process_frame()
-            status = analyzer.get_status()
+                frame = analyzer.process_frame()
+                status = analyzer.get_status()
 
-            full_statuses.append(status)
-            road_status_dict[status["road"]] = status["alert"]
+                full_statuses.append(status)
+                road_status_dict[status["road"]] = status["alert"]
 
-            # Log results
-            logger.log(status)
+                # Log results
+                logger.log(status)
 
-            # Show camera feed
-            if frame is not None:
-                cv2.imshow(f"{status['road']} Camera", frame)
+                # Alert evidence clips
+                recorders[analyzer.road_name].push(frame, analyzer.alert_active)
 
-        # Update LED board
-        led_board.update(road_status_dict)
+                # Show camera feed
+                if frame is not None:
+                    cv2.imshow(f"{status['road']} Camera", frame)
 
-        # Update junction fusion
-        junction_logic.update(full_statuses)
+            # Update LED board
+            led_board.update(road_status_dict)
 
-        # Quit control (Reliable)
-        key = cv2.waitKey(10) & 0xFF
-        if key == ord("q") or key == 27:
-            print("\n[INFO] Exit key pressed. Closing system...")
-            break
+            # Update junction fusion
+            junction_logic.update(full_statuses)
+
+            # Periodic checkpoint for warm restart
+            checkpointer.maybe_save(analyzers)
+
+            # Quit control (Reliable)
+            key = cv2.waitKey(MAIN_LOOP_WAIT_MS) & 0xFF
+            if key == ord("q") or key == 27:
+                print("\n[INFO] Exit key pressed. Closing system...")
+                break
+
+    finally:
+        checkpointer.save(analyzers)
+
+        # Release video resources
+        for analyzer in analyzers:
+            analyzer.cap.release()
 
-    # Release video resources
-    for analyzer in analyzers:
-        analyzer.cap.release()
+        # Flush pending clips
+        for recorder in recorders.values():
+            recorder.close()
 
     cv2.destroyAllWindows()
     print("[INFO] System Stopped Successfully.\n")
@@ -0,0 +1,87 @@
+import argparse
+import multiprocessing as mp
+import os
+import time
+
+from core.offline import (
+    init_worker,
+    plan_segments,
+    process_segment,
+    save_columns,
+    stitch_segments
+)
+
+
+def parse_args():
+
+    parser = argparse.ArgumentParser(
+        description="Offline segment-parallel RoadAnalyzer over recorded video"
+    )
+    parser.add_argument(
+        "--video", action="append", required=True, metavar="ROAD=PATH",
+        help="road name and video file, e.g. MAIN=videos/highway.mp4 (repeatable)"
+    )
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument(
+        "--segments", type=int, default=0,
+        help="segments per video (default: one per worker)"
+    )
+    parser.add_argument(
+        "--overlap", type=float, default=8.0,
+        help="warm-up seconds before each segment (>= alert hold time)"
+    )
+    parser.add_argument("--weights", default="yolov8n.pt")
+    parser.add_argument("--out-dir", default="logs/offline")
+
+    return parser.parse_args()
+
+
+def main():
+
+    args = parse_args()
+
+    print("\n[INFO] Offline Batch Processing Started...\n")
+    started = time.perf_counter()
+
+    segments = args.segments or args.workers
+    torch_threads = max(1, (os.cpu_count() or 1) // args.workers)
+
+    tasks = []
+    for spec in args.video:
+        road, video_path = spec.split("=", 1)
+        road_tasks = plan_segments(road, video_path, segments, args.overlap)
+        print(f"[INFO] {road}: {video_path} → {len(road_tasks)} segments")
+        tasks.extend(road_tasks)
+
+    # Longest segments first keeps all workers busy until the end
+    tasks.sort(key=lambda t: t["end"] - t["warmup_start"], reverse=True)
+
+    results = {}
+    ctx = mp.get_context("spawn")
+
+    with ctx.Pool(
+        args.workers,
+        initializer=init_worker,
+        initargs=(args.weights, torch_threads)
+    ) as pool:
+
+        for done, (road, start, columns) in enumerate(
+            pool.imap_unordered(process_segment, tasks), 1
+        ):
+            results.setdefault(road, []).append((start, columns))
+            print(f"[INFO] Segment {done}/{len(tasks)} done ({road} @ frame {start})")
+
+    for road, segment_results in results.items():
+
+        columns = stitch_segments(segment_results)
+        filename = os.path.join(args.out_dir, f"{road}.npz")
+        save_columns(filename, columns)
+
+        print(f"[INFO] {road}: {len(columns['frame'])} frames,"
+              f" {int(columns['alert'].sum())} alert frames → {filename}")
+
+    print(f"\n[INFO] Done in {time.perf_counter() - started:.1f}s\n")
+
+
+if __name__ == "__main__":
+    main()